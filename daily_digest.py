@@ -16,19 +16,31 @@ Architecture:
 import os
 import re
 import json
+import time
+import random
 import hashlib
 import requests
 import feedparser
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timedelta, timezone
+from itertools import chain
 from pathlib import Path
 from urllib.parse import urlparse
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
 # ─── Configuration ───────────────────────────────────────────────────────────
 
 ANTHROPIC_API_KEY = os.environ["ANTHROPIC_API_KEY"]
-SLACK_WEBHOOK_URL = os.environ.get("SLACK_WEBHOOK_URL", "")
+# Comma-separated to post the same digest to several channels
+SLACK_WEBHOOK_URLS = [u.strip() for u in os.environ.get("SLACK_WEBHOOK_URL", "").split(",") if u.strip()]
 CLAUDE_API_URL = "https://api.anthropic.com/v1/messages"
+CLAUDE_BATCH_URL = "https://api.anthropic.com/v1/messages/batches"
+USE_BATCH = os.environ.get("USE_BATCH") == "1"  # 50% cheaper, but results can take a while
 MODEL = "claude-haiku-4-5-20251001"
 
 HISTORY_FILE = Path("history.json")
@@ -37,6 +49,31 @@ PROMPT_HISTORY_DAYS = 30
 SCORE_THRESHOLD = 6.0
 TOP_N = 10
 FETCH_HOURS = 48
+HTTP_POOL_SIZE = 10  # matches the Hacker News fetch workers
+
+# One pooled session for every HTTP call so repeat requests to the same host
+# (HN items, the two Claude calls) reuse keep-alive connections.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE))
+
+
+def response_preview(response, limit: int = 200) -> str:
+    """First `limit` bytes of a response body, for error logs."""
+    # Decode only the prefix: response.text would run charset detection over
+    # the whole body and decode all of it just to be sliced
+    return response.content[:limit].decode("utf-8", "replace")
+
+
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    # Match orjson's raw UTF-8 and compact separators so both produce identical
+    # bytes; save_history's unchanged-file check relies on it
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
 
 # ─── Source Configuration ────────────────────────────────────────────────────
 
@@ -81,14 +118,14 @@ def fetch_hackernews(config: dict) -> list[dict]:
     items = []
     try:
         print("  📡 Fetching Hacker News...")
-        resp = requests.get(
+        resp = SESSION.get(
             "https://hacker-news.firebaseio.com/v0/topstories.json", timeout=10
         )
         story_ids = resp.json()[: config["top_stories"]]
 
         def fetch_story(sid):
             try:
-                r = requests.get(
+                r = SESSION.get(
                     f"https://hacker-news.firebaseio.com/v0/item/{sid}.json",
                     timeout=5,
                 )
@@ -178,7 +215,7 @@ def fetch_reddit(config: dict) -> list[dict]:
     for sub in config["subreddits"]:
         try:
             url = f"https://www.reddit.com/r/{sub['name']}/{sub['sort']}.json?limit={sub['limit']}"
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = SESSION.get(url, headers=headers, timeout=10)
             if resp.status_code != 200:
                 print(f"     ⚠️ Reddit r/{sub['name']} returned {resp.status_code}")
                 continue
@@ -217,13 +254,17 @@ def fetch_all_sources() -> list[dict]:
     print("\n📡 PHASE 1: Fetching from all sources...")
     all_items = []
 
-    if CONFIG["hackernews"]["enabled"]:
-        all_items.extend(fetch_hackernews(CONFIG["hackernews"]))
-
-    all_items.extend(fetch_rss(CONFIG["rss"]))
-
-    if CONFIG["reddit"]["enabled"]:
-        all_items.extend(fetch_reddit(CONFIG["reddit"]))
+    # Sources are independent, so fetch them concurrently. Results are merged in
+    # the fixed HN → RSS → Reddit order because dedup keeps the first title seen.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = []
+        if CONFIG["hackernews"]["enabled"]:
+            futures.append(ex.submit(fetch_hackernews, CONFIG["hackernews"]))
+        futures.append(ex.submit(fetch_rss, CONFIG["rss"]))
+        if CONFIG["reddit"]["enabled"]:
+            futures.append(ex.submit(fetch_reddit, CONFIG["reddit"]))
+        for future in futures:
+            all_items.extend(future.result())
 
     print(f"   Total raw items: {len(all_items)}")
     return all_items
@@ -281,6 +322,100 @@ def deduplicate(items: list[dict]) -> list[dict]:
     return unique
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# CLAUDE API
+# ═══════════════════════════════════════════════════════════════════════════════
+
+CLAUDE_HEADERS = {
+    "x-api-key": ANTHROPIC_API_KEY,
+    "content-type": "application/json",
+    "anthropic-version": "2023-06-01",
+}
+CLAUDE_RETRY_STATUSES = {429, 500, 502, 503, 504, 529}
+CLAUDE_MAX_RETRIES = 4
+BATCH_POLL_SECONDS = 30
+BATCH_MAX_WAIT_SECONDS = 2 * 60 * 60  # well inside the 6h GitHub Actions job limit
+
+
+def post_claude(payload: dict, timeout: int, stream: bool = False, url: str = CLAUDE_API_URL):
+    """POST to the Messages API, backing off on rate limits, overload and 5xx.
+
+    Returns the last response, so callers still handle non-200 statuses.
+    """
+    body = dump_json(payload)  # encoded once, reused across retries
+    for attempt in range(CLAUDE_MAX_RETRIES + 1):
+        try:
+            response = SESSION.post(
+                url, headers=CLAUDE_HEADERS, data=body, timeout=timeout, stream=stream
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt == CLAUDE_MAX_RETRIES:
+                raise
+            delay = min(60, 2 ** attempt) + random.random()
+            print(f"   ⚠️ Claude request failed ({e}), retrying in {delay:.0f}s...")
+            time.sleep(delay)
+            continue
+
+        if response.status_code not in CLAUDE_RETRY_STATUSES or attempt == CLAUDE_MAX_RETRIES:
+            return response
+
+        try:
+            delay = min(60, float(response.headers["retry-after"]))
+        except (KeyError, ValueError):
+            delay = min(60, 2 ** attempt) + random.random()
+        response.close()
+        print(f"   ⚠️ Claude API returned {response.status_code}, retrying in {delay:.0f}s...")
+        time.sleep(delay)
+
+
+def run_claude_batch(payload: dict) -> dict | None:
+    """Run one Messages request through the Batches API and wait for its result.
+
+    Returns the message (same shape as a /v1/messages response), or None on failure.
+    """
+    params = {k: v for k, v in payload.items() if k != "stream"}
+    try:
+        response = post_claude(
+            {"requests": [{"custom_id": "digest", "params": params}]},
+            timeout=30,
+            url=CLAUDE_BATCH_URL,
+        )
+        if response.status_code != 200:
+            print(f"   ❌ Batch submit error {response.status_code}: {response_preview(response)}")
+            return None
+        batch = response.json()
+        print(f"   📦 Submitted batch {batch['id']}, polling every {BATCH_POLL_SECONDS}s...")
+
+        waited = 0
+        while batch["processing_status"] != "ended":
+            if waited >= BATCH_MAX_WAIT_SECONDS:
+                print(f"   ❌ Batch {batch['id']} not done after {waited}s, cancelling")
+                SESSION.post(
+                    f"{CLAUDE_BATCH_URL}/{batch['id']}/cancel", headers=CLAUDE_HEADERS, timeout=30
+                )
+                return None
+            time.sleep(BATCH_POLL_SECONDS)
+            waited += BATCH_POLL_SECONDS
+            response = SESSION.get(
+                f"{CLAUDE_BATCH_URL}/{batch['id']}", headers=CLAUDE_HEADERS, timeout=30
+            )
+            if response.status_code == 200:
+                batch = response.json()
+
+        response = SESSION.get(batch["results_url"], headers=CLAUDE_HEADERS, timeout=60)
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            result = json.loads(line)["result"]
+            if result["type"] == "succeeded":
+                return result["message"]
+            print(f"   ❌ Batch request {result['type']}: {result.get('error')}")
+    except (requests.RequestException, KeyError, ValueError) as e:
+        print(f"   ❌ Batch failed: {e}")
+    return None
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PHASE 3: AI SCORING
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -305,12 +440,6 @@ Items:
 Respond with ONLY a JSON array of scores, one per item, in order. Example: [7, 3, 9, ...]
 No other text."""
 
-    headers = {
-        "x-api-key": ANTHROPIC_API_KEY,
-        "content-type": "application/json",
-        "anthropic-version": "2023-06-01",
-    }
-
     payload = {
         "model": MODEL,
         "max_tokens": 1024,
@@ -319,15 +448,22 @@ No other text."""
     }
 
     try:
-        response = requests.post(CLAUDE_API_URL, headers=headers, json=payload, timeout=30)
-        if response.status_code != 200:
-            print(f"   ❌ Scoring API error {response.status_code}: {response.text[:200]}")
+        if USE_BATCH:
+            data = run_claude_batch(payload)
+        else:
+            response = post_claude(payload, timeout=30)
+            if response.status_code != 200:
+                print(f"   ❌ Scoring API error {response.status_code}: {response_preview(response)}")
+                data = None
+            else:
+                data = response.json()
+
+        if data is None:
             # Fallback: use source score hints
             for item in items:
                 item["ai_score"] = min(item.get("score_hint", 0) / 50, 10)
             return items
 
-        data = response.json()
         text = ""
         for block in data.get("content", []):
             if block.get("type") == "text":
@@ -362,13 +498,11 @@ def filter_top_stories(items: list[dict], history_titles: list[str]) -> list[dic
     """Filter to top N items above threshold, excluding history."""
     print(f"\n🎯 PHASE 4: Filtering top {TOP_N}...")
 
-    # Remove items that match history
-    history_normalized = {normalize_title(t) for t in history_titles}
+    # Remove items that match history (close match = first 50 normalized chars)
+    history_prefixes = {normalize_title(t)[:50] for t in history_titles}
     fresh = []
     for item in items:
-        item_norm = normalize_title(item["title"])
-        # Check if any history title is a close match (first 50 chars)
-        if item_norm[:50] in {h[:50] for h in history_normalized}:
+        if normalize_title(item["title"])[:50] in history_prefixes:
             continue
         fresh.append(item)
 
@@ -389,6 +523,40 @@ def filter_top_stories(items: list[dict], history_titles: list[str]) -> list[dic
 # PHASE 5: ENRICH
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# An item ends at ===END===, or at the next item header if the model skipped it
+ENRICH_ITEM_RE = re.compile(
+    r"===ITEM (\d+)===(.*?)(?:===END===|(?====ITEM \d+===))", re.DOTALL
+)
+ENRICH_TAIL_RE = re.compile(r"===ITEM (\d+)===(.*)", re.DOTALL)
+ENRICH_FIELD_RE = re.compile(
+    r"^[ \t]*(SUMMARY|WHY_IT_MATTERS|BACKGROUND|CATEGORY):(.*)$", re.MULTILINE
+)
+
+
+def iter_text_deltas(response):
+    """Yield text deltas from a streamed (server-sent events) Claude response."""
+    # Raw bytes: text/event-stream has no charset, so requests would guess latin-1
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        event = json.loads(line[len(b"data:"):])
+        if event.get("type") == "content_block_delta":
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                yield delta["text"]
+        elif event.get("type") == "error":
+            raise RuntimeError(event.get("error", {}).get("message", "stream error"))
+
+
+def apply_enrichment(match: re.Match, stories: list[dict]):
+    """Apply the fields of one matched ===ITEM n=== block to stories[n-1]."""
+    index = int(match.group(1)) - 1
+    if 0 <= index < len(stories):
+        stories[index].update(
+            {m.group(1).lower(): m.group(2).strip() for m in ENRICH_FIELD_RE.finditer(match.group(2))}
+        )
+
+
 def enrich_stories(stories: list[dict]) -> list[dict]:
     """Use AI to generate summaries, 'why it matters', and background context."""
     print(f"\n✨ PHASE 5: Enriching {len(stories)} stories...")
@@ -414,15 +582,10 @@ CATEGORY: [One of: Model Release, Company Engineering, Research, Infrastructure,
 ===ITEM 2===
 ...and so on for all items. Use real facts only — do not invent details."""
 
-    headers = {
-        "x-api-key": ANTHROPIC_API_KEY,
-        "content-type": "application/json",
-        "anthropic-version": "2023-06-01",
-    }
-
     payload = {
         "model": MODEL,
         "max_tokens": 4096,
+        "stream": True,
         "system": (
             "You are a concise tech news enricher. "
             "No narration or commentary — just the structured output requested."
@@ -431,32 +594,31 @@ CATEGORY: [One of: Model Release, Company Engineering, Research, Infrastructure,
     }
 
     try:
-        response = requests.post(CLAUDE_API_URL, headers=headers, json=payload, timeout=60)
-        if response.status_code != 200:
-            print(f"   ❌ Enrichment API error {response.status_code}: {response.text[:200]}")
-            return stories
-
-        data = response.json()
-        text = ""
-        for block in data.get("content", []):
-            if block.get("type") == "text":
-                text += block["text"]
-
-        # Parse enrichments
-        for i, story in enumerate(stories):
-            marker = f"===ITEM {i+1}==="
-            if marker in text:
-                chunk = text.split(marker)[1]
-                if "===END===" in chunk:
-                    chunk = chunk.split("===END===")[0]
-                elif f"===ITEM {i+2}===" in chunk:
-                    chunk = chunk.split(f"===ITEM {i+2}===")[0]
-
-                for field in ["SUMMARY", "WHY_IT_MATTERS", "BACKGROUND", "CATEGORY"]:
-                    for line in chunk.split("\n"):
-                        line = line.strip()
-                        if line.startswith(f"{field}:"):
-                            story[field.lower()] = line[len(field) + 1:].strip()
+        if USE_BATCH:
+            data = run_claude_batch(payload)
+            if data is None:
+                return stories
+            deltas = [b["text"] for b in data.get("content", []) if b.get("type") == "text"]
+        else:
+            response = post_claude(payload, timeout=60, stream=True)
+            if response.status_code != 200:
+                print(f"   ❌ Enrichment API error {response.status_code}: {response_preview(response)}")
+                return stories
+            deltas = iter_text_deltas(response)
+
+        # Parse each ===ITEM n=== block as soon as its terminator arrives,
+        # resuming the scan where the previous block ended
+        buffer, pos = "", 0
+        for delta in deltas:
+            buffer += delta
+            for match in ENRICH_ITEM_RE.finditer(buffer, pos):
+                apply_enrichment(match, stories)
+                pos = match.end()
+
+        # The last item may be cut off by max_tokens
+        tail = ENRICH_TAIL_RE.search(buffer, pos)
+        if tail:
+            apply_enrichment(tail, stories)
 
         enriched = sum(1 for s in stories if s.get("summary"))
         print(f"   Enriched {enriched}/{len(stories)} stories")
@@ -481,18 +643,83 @@ CATEGORY_EMOJI = {
     "open source": "🔓",
     "product launch": "🚀",
 }
+DEFAULT_CATEGORY_EMOJI = "📰"
+# The model answers with the Title Case labels from the prompt, so look those up
+# directly and only lowercase anything unexpected
+CATEGORY_EMOJI_BY_LABEL = {
+    **CATEGORY_EMOJI,
+    **{cat.title(): emoji for cat, emoji in CATEGORY_EMOJI.items()},
+}
 
 
-def publish_to_slack(stories: list[dict]):
-    """Build and post Slack Block Kit message."""
-    if not SLACK_WEBHOOK_URL:
-        print("   ⚠️ No SLACK_WEBHOOK_URL set, skipping Slack")
-        return
+def category_emoji(category: str) -> str:
+    """Emoji for an enrichment category, tolerant of casing."""
+    return CATEGORY_EMOJI_BY_LABEL.get(category) or CATEGORY_EMOJI.get(
+        category.lower(), DEFAULT_CATEGORY_EMOJI
+    )
 
-    print(f"\n📤 PHASE 6a: Posting to Slack...")
+
+SLACK_MAX_BLOCKS = 50  # Block Kit limit per message
+# Each story is a section + divider; reserve room for header, intro, divider and footer
+SLACK_STORIES_PER_MESSAGE = (SLACK_MAX_BLOCKS - 4) // 2
+
+# Shared block dicts — they are only ever serialized, never mutated
+SLACK_DIVIDER = {"type": "divider"}
+SLACK_FOOTER = {
+    "type": "context",
+    "elements": [
+        {
+            "type": "mrkdwn",
+            "text": (
+                "🛠️ Powered by AI Daily Digest v2 "
+                "| Sources: HN + Reddit + RSS + Engineering Blogs "
+                "| Scored & enriched by Claude"
+            ),
+        }
+    ],
+}
+
+# Slack treats &, < and > as control characters in mrkdwn, and | ends a link URL
+SLACK_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "|": "｜"})
+SLACK_URL_ESCAPES = str.maketrans({"<": "%3C", ">": "%3E", "|": "%7C"})
+
+
+def slack_link(url: str, title: str) -> str:
+    """Render a Slack mrkdwn link, escaping characters that would break the markup."""
+    title = title.translate(SLACK_TEXT_ESCAPES)
+    if not url:
+        return title
+    return f"<{url.translate(SLACK_URL_ESCAPES)}|{title}>"
+
+
+def slack_story_text(i: int, story: dict) -> str:
+    """Render one story as Slack mrkdwn."""
+    emoji = category_emoji(story.get("category", ""))
+    title = story.get("title", "Untitled")
+    url = story.get("url", "")
+    summary = story.get("summary", "")
+    why = story.get("why_it_matters", "")
+    background = story.get("background", "")
+    source = story.get("source", "")
+    score = story.get("ai_score", 0)
+
+    title_text = slack_link(url, title)
+    parts = [f"{emoji} *#{i} — {title_text}*\n_{source} · Score: {score:.0f}/10_"]
+
+    if summary:
+        parts.append(summary)
+    if why:
+        parts.append(f"💡 *Why it matters:* {why}")
+    if background:
+        parts.append(f"📚 _{background}_")
+    return "\n\n".join(parts)
+
+
+def build_slack_messages(stories: list[dict]) -> list[dict]:
+    """Build Block Kit messages, splitting stories so no message exceeds Slack's block cap."""
     today = datetime.now().strftime("%A, %B %d, %Y")
 
-    blocks = [
+    header_blocks = [
         {
             "type": "header",
             "text": {
@@ -511,60 +738,58 @@ def publish_to_slack(stories: list[dict]):
                 ),
             },
         },
-        {"type": "divider"},
+        SLACK_DIVIDER,
     ]
 
-    for i, story in enumerate(stories, 1):
-        cat = story.get("category", "").lower()
-        emoji = CATEGORY_EMOJI.get(cat, "📰")
-        title = story.get("title", "Untitled")
-        url = story.get("url", "")
-        summary = story.get("summary", "")
-        why = story.get("why_it_matters", "")
-        background = story.get("background", "")
-        source = story.get("source", "")
-        score = story.get("ai_score", 0)
+    story_blocks = list(
+        chain.from_iterable(
+            (
+                {"type": "section", "text": {"type": "mrkdwn", "text": slack_story_text(i, story)}},
+                SLACK_DIVIDER,
+            )
+            for i, story in enumerate(stories, 1)
+        )
+    )
 
-        title_text = f"<{url}|{title}>" if url else title
-        text = f"{emoji} *#{i} — {title_text}*"
-        text += f"\n_{source} · Score: {score:.0f}/10_"
+    step = SLACK_STORIES_PER_MESSAGE * 2
+    messages = [
+        {"blocks": story_blocks[start:start + step]}
+        for start in range(0, len(story_blocks), step)
+    ] or [{"blocks": []}]
+    messages[0]["blocks"][:0] = header_blocks
+    messages[-1]["blocks"].append(SLACK_FOOTER)
+    return messages
 
-        if summary:
-            text += f"\n\n{summary}"
-        if why:
-            text += f"\n\n💡 *Why it matters:* {why}"
-        if background:
-            text += f"\n\n📚 _{background}_"
 
-        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": text}})
-        blocks.append({"type": "divider"})
+def publish_to_slack(stories: list[dict]):
+    """Build and post Slack Block Kit message(s) to every configured webhook."""
+    if not SLACK_WEBHOOK_URLS:
+        print("   ⚠️ No SLACK_WEBHOOK_URL set, skipping Slack")
+        return
 
-    blocks.append(
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": (
-                        "🛠️ Powered by AI Daily Digest v2 "
-                        "| Sources: HN + Reddit + RSS + Engineering Blogs "
-                        "| Scored & enriched by Claude"
-                    ),
-                }
-            ],
-        }
-    )
+    print(f"\n📤 PHASE 6a: Posting to Slack...")
+    messages = build_slack_messages(stories)
+
+    bodies = [dump_json(message) for message in messages]  # shared by every webhook
+
+    def post_one(n, webhook_url):
+        # Webhook URLs are secrets, so logs name them by position in SLACK_WEBHOOK_URL
+        label = f"webhook {n}/{len(SLACK_WEBHOOK_URLS)}"
+        # Post in order on one webhook; keep-alive reuses the connection
+        for body in bodies:
+            resp = SESSION.post(
+                webhook_url,
+                data=body,
+                headers={"Content-Type": "application/json"},
+                timeout=10,
+            )
+            if resp.status_code != 200:
+                print(f"   ❌ Slack {label} failed ({resp.status_code}): {response_preview(resp)}")
+                return
+        print(f"   ✅ Posted to Slack ({label})!")
 
-    message = {"blocks": blocks}
-    resp = requests.post(
-        SLACK_WEBHOOK_URL,
-        json=message,
-        headers={"Content-Type": "application/json"},
-    )
-    if resp.status_code != 200:
-        print(f"   ❌ Slack webhook failed ({resp.status_code}): {resp.text}")
-    else:
-        print("   ✅ Posted to Slack!")
+    with ThreadPoolExecutor(max_workers=len(SLACK_WEBHOOK_URLS)) as ex:
+        list(ex.map(post_one, range(1, len(SLACK_WEBHOOK_URLS) + 1), SLACK_WEBHOOK_URLS))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -598,7 +823,7 @@ def publish_to_pages(stories: list[dict]):
 
     for i, story in enumerate(stories, 1):
         cat = story.get("category", "")
-        emoji = CATEGORY_EMOJI.get(cat.lower(), "📰")
+        emoji = category_emoji(cat)
         title = story.get("title", "Untitled")
         url = story.get("url", "")
         summary = story.get("summary", "")
@@ -674,31 +899,52 @@ def load_history() -> dict:
     """Load story history from file."""
     if HISTORY_FILE.exists():
         try:
+            if orjson:
+                return orjson.loads(HISTORY_FILE.read_bytes())
             return json.loads(HISTORY_FILE.read_text())
-        except (json.JSONDecodeError, IOError):
+        except (json.JSONDecodeError, IOError):  # orjson.JSONDecodeError subclasses this
             return {}
     return {}
 
 
-def save_history(history: dict, stories: list[dict]):
-    """Save today's stories to history."""
+def save_history(history: dict, stories: list[dict]) -> bool:
+    """Save today's stories to history. Returns False if the file was already up to date."""
     today_key = datetime.now().strftime("%Y-%m-%d")
     history[today_key] = [
         {"title": s.get("title", ""), "url": s.get("url", "")}
         for s in stories
     ]
-    HISTORY_FILE.write_text(json.dumps(history, indent=2))
+    data = dump_json(history, indent=True)
+
+    # Same-day reruns with the same stories leave the file untouched
+    if HISTORY_FILE.exists() and HISTORY_FILE.read_bytes() == data:
+        return False
+
+    # Write to a temp file and swap it in so a crash never leaves a partial file
+    tmp_file = HISTORY_FILE.with_name(HISTORY_FILE.name + ".tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, HISTORY_FILE)
+    return True
 
 
 def get_recent_titles(history: dict) -> list[str]:
     """Get story titles from recent history for dedup."""
     cutoff = (datetime.now() - timedelta(days=PROMPT_HISTORY_DAYS)).strftime("%Y-%m-%d")
     titles = []
-    for date, stories in history.items():
-        if date >= cutoff:
-            for story in stories:
-                titles.append(story.get("title", ""))
-    return [t for t in titles if t][:100]
+    seen = set()
+    # Walk newest-first so older days are never touched once past the cutoff
+    # or once the cap is reached
+    for date in sorted(history, reverse=True):
+        if date < cutoff:
+            break
+        for story in history[date]:
+            title = story.get("title", "")
+            if title and title not in seen:
+                seen.add(title)
+                titles.append(title)
+                if len(titles) == 100:
+                    return titles
+    return titles
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -736,13 +982,16 @@ def main():
     # Phase 5: Enrich
     enriched_stories = enrich_stories(top_stories)
 
-    # Phase 6: Publish
-    publish_to_slack(enriched_stories)
-    publish_to_pages(enriched_stories)
-
-    # Phase 7: Save history
-    save_history(history, enriched_stories)
-    print(f"\n💾 Saved {len(enriched_stories)} stories to history")
+    # Phase 6 + 7: Post to Slack in the background while the disk-bound
+    # Pages and history writes run, then wait for the post to finish
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        slack_future = ex.submit(publish_to_slack, enriched_stories)
+        publish_to_pages(enriched_stories)
+        if save_history(history, enriched_stories):
+            print(f"\n💾 Saved {len(enriched_stories)} stories to history")
+        else:
+            print("\n💾 History already up to date")
+        slack_future.result()
 
     print("\n" + "=" * 60)
     print("✅ Done!")